@@ -25,13 +25,19 @@ with require_modules(required_modules) as missing_modules:
         from .base import (
             TracedGraphQLSchema, traced_graphql,
             TYPE, SERVICE, QUERY, ERRORS, INVALID, RES_NAME, DATA_EMPTY,
-            CLIENT_ERROR
+            CLIENT_ERROR, CPU_TIME, CPU_RATIO, DEADLINE_EXCEEDED,
+            FIELDS_SKIPPED, INTROSPECTION, INTROSPECTION_CACHE_HIT,
+            INTROSPECTION_CACHE_SIZE
         )
+        from .deadline import DeadlineExceeded
         from .patch import patch, unpatch
         __all__ = [
             'TracedGraphQLSchema',
             'patch', 'unpatch', 'traced_graphql',
             'TYPE', 'SERVICE', 'QUERY', 'ERRORS', 'INVALID',
-            'RES_NAME', 'DATA_EMPTY', 'CLIENT_ERROR',
+            'RES_NAME', 'DATA_EMPTY', 'CLIENT_ERROR', 'CPU_TIME', 'CPU_RATIO',
+            'DEADLINE_EXCEEDED', 'FIELDS_SKIPPED', 'DeadlineExceeded',
+            'INTROSPECTION', 'INTROSPECTION_CACHE_HIT',
+            'INTROSPECTION_CACHE_SIZE',
         ]
 
@@ -1,10 +1,12 @@
 import logging
 import os
+import time
 
 import ddtrace
 import graphql
 from ddtrace.ext import errors as ddtrace_errors
 
+from ddtrace_graphql import deadline as _deadline
 from ddtrace_graphql import utils
 
 logger = logging.getLogger(__name__)
@@ -17,6 +19,13 @@ ERRORS = 'errors'
 INVALID = 'invalid'
 CLIENT_ERROR = 'client_error'
 DATA_EMPTY = 'data_empty'
+CPU_TIME = 'cpu_time'
+CPU_RATIO = 'cpu_ratio'
+DEADLINE_EXCEEDED = 'deadline_exceeded'
+FIELDS_SKIPPED = 'fields_skipped'
+INTROSPECTION = 'introspection'
+INTROSPECTION_CACHE_HIT = 'introspection_cache_hit'
+INTROSPECTION_CACHE_SIZE = 16
 RES_NAME = 'graphql.graphql'
 #
 SERVICE_ENV_VAR = 'DDTRACE_GRAPHQL_SERVICE'
@@ -25,6 +34,10 @@ SERVICE = 'graphql'
 
 class TracedGraphQLSchema(graphql.GraphQLSchema):
     def __init__(self, *args, **kwargs):
+        # results of introspection queries, ``None`` if caching is disabled
+        self.introspection_cache = (
+            utils.LRUCache(INTROSPECTION_CACHE_SIZE)
+            if kwargs.pop('cache_introspection', False) else None)
         if 'datadog_tracer' in kwargs:
             self.datadog_tracer = kwargs.pop('datadog_tracer')
             logger.debug(
@@ -32,6 +45,33 @@ class TracedGraphQLSchema(graphql.GraphQLSchema):
                 self, self.datadog_tracer)
         super(TracedGraphQLSchema, self).__init__(*args, **kwargs)
 
+    def __setattr__(self, name, value):
+        super(TracedGraphQLSchema, self).__setattr__(name, value)
+        # schema reassigned, cached introspection results are stale
+        if name != 'introspection_cache':
+            self.invalidate_introspection_cache()
+
+    def invalidate_introspection_cache(self):
+        """
+        Clears cached introspection results, call it after changing types or
+        fields of the schema in place.
+        """
+        if getattr(self, 'introspection_cache', None):
+            self.introspection_cache.clear()
+
+
+def _execute(func, args, kwargs, cache, cache_key, deadline_middleware=None):
+    """
+    Executes ``func`` and stores introspection result under ``cache_key``.
+    """
+    result = func(*args, **kwargs)
+    if deadline_middleware is not None:
+        deadline_middleware.add_error(result)
+    # shed results carry ``DeadlineExceeded`` error, never cached
+    if cache_key is not None and not result.errors:
+        cache.set(cache_key, result)
+    return result
+
 
 def traced_graphql_wrapped(
     func,
@@ -40,6 +80,8 @@ def traced_graphql_wrapped(
     span_kwargs=None,
     span_callback=None,
     ignore_exceptions=(),
+    deadline=None,
+    deadlines=None,
 ):
     """
     Wrapper for graphql.graphql function.
@@ -48,26 +90,78 @@ def traced_graphql_wrapped(
     schema = args[0]
     tracer = getattr(schema, 'datadog_tracer', ddtrace.tracer)
 
-    if not tracer.enabled:
+    # introspection cache works regardless of tracing
+    cache = getattr(schema, 'introspection_cache', None)
+    if not tracer.enabled and cache is None:
         return func(*args, **kwargs)
 
     query = utils.get_query_string(args, kwargs)
 
+    introspection = False
+    cache_key = cached = None
+    if utils.maybe_introspection(query):
+        # only introspection results are cached, lookup before parsing
+        if cache is not None:
+            cache_key = utils.introspection_cache_key(query, args, kwargs)
+        if cache_key is not None:
+            cached = cache.get(cache_key)
+        introspection = cached is not None or utils.is_introspection(
+            utils.get_request_string(args, kwargs))
+        if not introspection:
+            cache_key = None
+
+    if not tracer.enabled:
+        if cached is not None:
+            return cached
+        return _execute(func, args, kwargs, cache, cache_key)
+
     _span_kwargs = {
         'name': RES_NAME,
         'span_type': TYPE,
         'service': os.getenv(SERVICE_ENV_VAR, SERVICE),
-        'resource': utils.resolve_query_res(query)
+        'resource': (
+            INTROSPECTION if introspection else utils.resolve_query_res(query)
+        )
     }
     _span_kwargs.update(span_kwargs or {})
 
+    deadline_middleware = None
+    timeout = _deadline.get_timeout(
+        _span_kwargs['resource'], deadline, deadlines)
+    if timeout is not None:
+        kwargs, deadline_middleware = _deadline.with_deadline(
+            args, kwargs, timeout)
+
     with tracer.trace(**_span_kwargs) as span:
-        span.set_tag(QUERY, query)
+        # introspection query is huge and always the same
+        if not introspection:
+            span.set_tag(QUERY, query)
+        span.set_metric(INTROSPECTION, int(introspection))
         result = None
+        wall_start = time.time()
+        cpu_start = utils.thread_cpu_time()
         try:
-            result = func(*args, **kwargs)
+            if cache_key is not None:
+                span.set_metric(
+                    INTROSPECTION_CACHE_HIT, int(cached is not None))
+            if cached is not None:
+                result = cached
+            else:
+                result = _execute(
+                    func, args, kwargs, cache, cache_key, deadline_middleware)
             return result
         finally:
+            cpu_time = utils.thread_cpu_time() - cpu_start
+            wall_time = time.time() - wall_start
+            span.set_metric(CPU_TIME, cpu_time)
+            span.set_metric(CPU_RATIO, utils.cpu_ratio(cpu_time, wall_time))
+
+            if deadline_middleware is not None:
+                # deadline is exceeded only when some load was shed
+                span.set_metric(
+                    DEADLINE_EXCEEDED, int(bool(deadline_middleware.skipped)))
+                span.set_metric(FIELDS_SKIPPED, deadline_middleware.skipped)
+
             # `span.error` must be integer
             span.error = int(result is None)
 
@@ -109,11 +203,15 @@ def traced_graphql(
     span_kwargs=None,
     span_callback=None,
     ignore_exceptions=(),
+    deadline=None,
+    deadlines=None,
     **kwargs
 ):
     return traced_graphql_wrapped(
         _graphql, args, kwargs,
         span_kwargs=span_kwargs,
         span_callback=span_callback,
-        ignore_exceptions=ignore_exceptions
+        ignore_exceptions=ignore_exceptions,
+        deadline=deadline,
+        deadlines=deadlines,
     )
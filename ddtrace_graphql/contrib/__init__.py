@@ -0,0 +1,112 @@
+"""
+Tracing for HTTP views serving graphql-core 2 schemas.
+
+Integrations create parent span for the whole request with child spans for
+request body parsing, ``graphql`` execution and response serialization::
+
+    from ddtrace_graphql.contrib import flask_graphql
+    flask_graphql.patch()
+"""
+
+import os
+
+import ddtrace
+from ddtrace.ext import http
+
+from ddtrace_graphql.base import (
+    SERVICE, SERVICE_ENV_VAR, traced_graphql_wrapped
+)
+
+
+REQUEST_RES_NAME = 'graphql.request'
+PARSE_BODY_RES_NAME = 'graphql.parse_body'
+ENCODE_RES_NAME = 'graphql.encode'
+REQUEST_SIZE = 'request.size'
+RESPONSE_SIZE = 'response.size'
+
+
+def get_tracer(view):
+    """
+    Returns tracer of the ``view``s schema with fall-back to the global one.
+    """
+    return getattr(view.schema, 'datadog_tracer', ddtrace.tracer)
+
+
+def trace(tracer, name, **span_kwargs):
+    """
+    Starts span ``name`` under graphql service using ``tracer``.
+    """
+    _span_kwargs = {
+        'service': os.getenv(SERVICE_ENV_VAR, SERVICE),
+    }
+    _span_kwargs.update(span_kwargs)
+    return tracer.trace(name, **_span_kwargs)
+
+
+def traced_request(
+    tracer,
+    func,
+    args,
+    kwargs,
+    method,
+    path,
+    url,
+    request_size,
+    response_size,
+):
+    """
+    Traces whole request handled by view's dispatch ``func``.
+
+    ``response_size`` is called with the response returned by ``func`` to
+    get its size in bytes.
+    """
+    with trace(
+        tracer,
+        REQUEST_RES_NAME,
+        span_type=http.TYPE,
+        resource='{} {}'.format(method, path),
+    ) as span:
+        span.set_tag(http.METHOD, method)
+        span.set_tag(http.URL, url)
+        span.set_metric(REQUEST_SIZE, request_size)
+        response = func(*args, **kwargs)
+        # GraphiQL may be rendered as plain string
+        status_code = getattr(response, 'status_code', None)
+        if status_code is not None:
+            span.set_tag(http.STATUS_CODE, status_code)
+        span.set_metric(RESPONSE_SIZE, response_size(response))
+        return response
+
+
+def traced_encode(tracer, func, args, kwargs):
+    """
+    Traces response serialization, ``func`` must return encoded string.
+    """
+    with trace(tracer, ENCODE_RES_NAME) as span:
+        result = func(*args, **kwargs)
+        # json is encoded with ``ensure_ascii`` so length equals to bytes size
+        span.set_metric(RESPONSE_SIZE, len(result) if result else 0)
+        return result
+
+
+def traced_parse_body(tracer, func, args, kwargs, request_size):
+    """
+    Traces parsing of request body with ``request_size`` bytes.
+    """
+    with trace(tracer, PARSE_BODY_RES_NAME) as span:
+        span.set_metric(REQUEST_SIZE, request_size)
+        return func(*args, **kwargs)
+
+
+def traced_execute(func, args, kwargs, schema, query):
+    """
+    Traces execution of ``query`` against ``schema`` done by view's ``func``.
+    """
+    def execute(*_args, **_kwargs):
+        return func(*args, **kwargs)
+
+    def set_size(result, span):
+        span.set_metric(REQUEST_SIZE, len(query.encode('utf-8')))
+
+    return traced_graphql_wrapped(
+        execute, (schema, query), {}, span_callback=set_size)
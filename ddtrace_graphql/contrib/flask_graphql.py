@@ -0,0 +1,108 @@
+"""
+Tracing for the flask-graphql ``GraphQLView``.
+
+https://github.com/graphql-python/flask-graphql
+"""
+
+import logging
+
+import flask
+import flask_graphql
+import graphql_server
+import wrapt
+from ddtrace.util import unwrap
+
+from ddtrace_graphql import contrib
+
+logger = logging.getLogger(__name__)
+
+# ``GraphQLView.encode`` is static method and query is executed by
+# ``graphql_server`` functions, tracer of the view is kept in ``flask.g`` for
+# the time of request
+_TRACER_ATTR = '_ddtrace_graphql_tracer'
+
+
+def _request_tracer():
+    """
+    Returns tracer of the view handling current request, if any.
+    """
+    tracer = flask.g.get(_TRACER_ATTR) if flask.has_app_context() else None
+    return tracer if tracer is not None and tracer.enabled else None
+
+
+def _dispatch_request(func, instance, args, kwargs):
+    tracer = contrib.get_tracer(instance)
+    if not tracer.enabled:
+        return func(*args, **kwargs)
+
+    request = flask.request
+    setattr(flask.g, _TRACER_ATTR, tracer)
+    try:
+        return contrib.traced_request(
+            tracer, func, args, kwargs,
+            method=request.method,
+            path=request.path,
+            url=request.base_url,
+            request_size=request.content_length or 0,
+            response_size=_response_size,
+        )
+    finally:
+        flask.g.pop(_TRACER_ATTR, None)
+
+
+def _response_size(response):
+    if isinstance(response, flask.Response):
+        return response.content_length or 0
+    # rendered GraphiQL page
+    return len(response.encode('utf-8'))
+
+
+def _parse_body(func, instance, args, kwargs):
+    tracer = contrib.get_tracer(instance)
+    if not tracer.enabled:
+        return func(*args, **kwargs)
+    return contrib.traced_parse_body(
+        tracer, func, args, kwargs,
+        request_size=flask.request.content_length or 0,
+    )
+
+
+def _encode(func, _, args, kwargs):
+    tracer = _request_tracer()
+    if tracer is None:
+        return func(*args, **kwargs)
+    return contrib.traced_encode(tracer, func, args, kwargs)
+
+
+def _execute_graphql_request(func, _, args, kwargs):
+    # ``graphql_server`` is shared by other integrations, trace flask only
+    params = args[1] if len(args) > 1 else kwargs.get('params')
+    if _request_tracer() is None or not params or not params.query:
+        return func(*args, **kwargs)
+    schema = args[0] if args else kwargs['schema']
+    return contrib.traced_execute(func, args, kwargs, schema, params.query)
+
+
+def patch():
+    """
+    Monkeypatches flask-graphql ``GraphQLView`` to trace requests.
+    """
+    view = flask_graphql.GraphQLView
+    logger.debug("Patching `flask_graphql.GraphQLView`.")
+    wrapt.wrap_function_wrapper(view, "dispatch_request", _dispatch_request)
+    wrapt.wrap_function_wrapper(view, "parse_body", _parse_body)
+    wrapt.wrap_function_wrapper(view, "encode", _encode)
+    wrapt.wrap_function_wrapper(
+        graphql_server, "execute_graphql_request", _execute_graphql_request)
+
+
+def unpatch():
+    view = flask_graphql.GraphQLView
+    logger.debug("Unpatching `flask_graphql.GraphQLView`.")
+    unwrap(view, "dispatch_request")
+    unwrap(view, "parse_body")
+    # ``unwrap`` would replace static method with plain function
+    encode = view.__dict__.get("encode")
+    if isinstance(encode, wrapt.ObjectProxy):
+        view.encode = encode.__wrapped__
+    unwrap(graphql_server, "execute_graphql_request")
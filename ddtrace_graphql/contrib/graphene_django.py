@@ -0,0 +1,101 @@
+"""
+Tracing for the graphene-django ``GraphQLView``.
+
+https://github.com/graphql-python/graphene-django
+"""
+
+import logging
+
+import graphene_django.views
+import wrapt
+from ddtrace.util import unwrap
+from django.core.exceptions import DisallowedHost
+
+from ddtrace_graphql import contrib
+
+logger = logging.getLogger(__name__)
+
+
+def _request_size(request):
+    try:
+        return int(request.META.get('CONTENT_LENGTH') or 0)
+    except ValueError:
+        return 0
+
+
+def _url(request):
+    # host validation must not fail the request being traced
+    try:
+        return request.build_absolute_uri(request.path)
+    except DisallowedHost:
+        return request.path
+
+
+def _response_size(response):
+    return 0 if response.streaming else len(response.content)
+
+
+def _dispatch(func, instance, args, kwargs):
+    tracer = contrib.get_tracer(instance)
+    if not tracer.enabled:
+        return func(*args, **kwargs)
+
+    request = args[0] if args else kwargs['request']
+    return contrib.traced_request(
+        tracer, func, args, kwargs,
+        method=request.method,
+        path=request.path,
+        url=_url(request),
+        request_size=_request_size(request),
+        response_size=_response_size,
+    )
+
+
+def _parse_body(func, instance, args, kwargs):
+    tracer = contrib.get_tracer(instance)
+    if not tracer.enabled:
+        return func(*args, **kwargs)
+
+    request = args[0] if args else kwargs['request']
+    return contrib.traced_parse_body(
+        tracer, func, args, kwargs,
+        request_size=_request_size(request),
+    )
+
+
+def _execute_graphql_request(func, instance, args, kwargs):
+    tracer = contrib.get_tracer(instance)
+    query = args[2] if len(args) > 2 else kwargs.get('query')
+    # no query means GraphiQL page or bad request, nothing to execute
+    if not tracer.enabled or not query:
+        return func(*args, **kwargs)
+    return contrib.traced_execute(func, args, kwargs, instance.schema, query)
+
+
+def _json_encode(func, instance, args, kwargs):
+    tracer = contrib.get_tracer(instance)
+    if not tracer.enabled:
+        return func(*args, **kwargs)
+    return contrib.traced_encode(tracer, func, args, kwargs)
+
+
+def patch():
+    """
+    Monkeypatches graphene-django ``GraphQLView`` to trace requests.
+    """
+    view = graphene_django.views.GraphQLView
+    logger.debug("Patching `graphene_django.views.GraphQLView`.")
+    wrapt.wrap_function_wrapper(view, "dispatch", _dispatch)
+    wrapt.wrap_function_wrapper(view, "parse_body", _parse_body)
+    wrapt.wrap_function_wrapper(
+        view, "execute_graphql_request", _execute_graphql_request)
+    wrapt.wrap_function_wrapper(view, "json_encode", _json_encode)
+
+
+def unpatch():
+    view = graphene_django.views.GraphQLView
+    logger.debug("Unpatching `graphene_django.views.GraphQLView`.")
+    unwrap(view, "dispatch")
+    unwrap(view, "parse_body")
+    unwrap(view, "execute_graphql_request")
+    unwrap(view, "json_encode")
@@ -0,0 +1,108 @@
+"""
+Execution deadlines for graphql operations.
+
+Once the operation runs out of its time budget, remaining resolvers are not
+called, their fields resolve to ``null`` and the partial result gets
+``DeadlineExceeded`` error.
+"""
+
+import logging
+import time
+
+from graphql.error import GraphQLError
+from graphql.execution.middleware import MiddlewareManager
+
+logger = logging.getLogger(__name__)
+
+
+class DeadlineExceeded(GraphQLError):
+    """
+    Error added to the result of operation which exceeded its deadline.
+    """
+
+
+class DeadlineMiddleware(object):
+    """
+    graphql-core middleware skipping resolvers after ``timeout`` seconds.
+    """
+
+    def __init__(self, timeout):
+        self.timeout = timeout
+        self.deadline = time.monotonic() + timeout
+        self.skipped = 0
+
+    @property
+    def exceeded(self):
+        return time.monotonic() >= self.deadline
+
+    def resolve(self, next, root, info, **args):
+        if self.skipped or self.exceeded:
+            self.skipped += 1
+            return None
+        return next(root, info, **args)
+
+    def add_error(self, result):
+        """
+        Adds ``DeadlineExceeded`` error to ``result`` if any field was skipped.
+        """
+        if not self.skipped or result is None:
+            return
+        result.errors = list(result.errors or []) + [
+            DeadlineExceeded(
+                'Deadline of {}s exceeded, {} fields skipped.'.format(
+                    self.timeout, self.skipped))
+        ]
+
+
+def get_timeout(resource, deadline, deadlines):
+    """
+    Returns timeout for operation ``resource``.
+
+    Per operation ``deadlines`` mapping takes precedence over the global
+    ``deadline``. ``None`` means no deadline.
+    """
+    if deadlines and resource in deadlines:
+        return deadlines[resource]
+    return deadline
+
+
+def _middlewares(middleware):
+    if isinstance(middleware, MiddlewareManager):
+        return middleware.middlewares
+    return middleware or ()
+
+
+def with_deadline(args, kwargs, timeout):
+    """
+    Adds ``DeadlineMiddleware`` to the ``middleware`` in ``kwargs``.
+
+    Returns new ``kwargs`` and the middleware, or ``None`` in case the
+    middleware is already present (nested traced calls share one deadline)
+    or can't be added.
+    """
+    # middleware may be among positional execution options
+    if len(args) > 6:
+        logger.debug(
+            'Positional execution options in %s, deadline skipped.', args)
+        return kwargs, None
+
+    middleware = kwargs.get('middleware')
+    middlewares = tuple(_middlewares(middleware))
+    if any(isinstance(m, DeadlineMiddleware) for m in middlewares):
+        return kwargs, None
+
+    deadline_middleware = DeadlineMiddleware(timeout)
+    # last middleware is the outermost one, skip before any other runs
+    middlewares += (deadline_middleware,)
+    # wrapping every resolved value in promise makes execution several
+    # times slower, skip it unless there is caller's middleware relying on it
+    # (graphql-core wraps plain middleware list by default)
+    if isinstance(middleware, MiddlewareManager):
+        wrap_in_promise = middleware.wrap_in_promise
+    else:
+        wrap_in_promise = bool(middleware)
+    middlewares = MiddlewareManager(
+        *middlewares, wrap_in_promise=wrap_in_promise)
+
+    kwargs = dict(kwargs, middleware=middlewares)
+    return kwargs, deadline_middleware
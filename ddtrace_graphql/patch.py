@@ -17,9 +17,18 @@ from ddtrace_graphql.base import traced_graphql_wrapped
 logger = logging.getLogger(__name__)
 
 
-def patch(span_kwargs=None, span_callback=None, ignore_exceptions=()):
+def patch(
+    span_kwargs=None,
+    span_callback=None,
+    ignore_exceptions=(),
+    deadline=None,
+    deadlines=None,
+):
     """
     Monkeypatches graphql-core library to trace graphql calls execution.
+
+    ``deadline`` is the default time budget in seconds for every operation,
+    ``deadlines`` maps operation resource to its own budget.
     """
 
     def wrapper(func, _, args, kwargs):
@@ -30,6 +39,8 @@ def patch(span_kwargs=None, span_callback=None, ignore_exceptions=()):
             span_kwargs=span_kwargs,
             span_callback=span_callback,
             ignore_exceptions=ignore_exceptions,
+            deadline=deadline,
+            deadlines=deadlines,
         )
 
     logger.debug("Patching `graphql.graphql` function.")
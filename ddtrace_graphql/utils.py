@@ -1,10 +1,14 @@
 import json
 import re
+import threading
+import time
 import traceback
+from collections import OrderedDict
 from io import StringIO
 
 from graphql.error import GraphQLError, format_error
-from graphql.language.ast import Document
+from graphql.language.ast import Document, Field, OperationDefinition
+from graphql.language.parser import parse
 
 
 def get_request_string(args, kwargs):
@@ -22,6 +26,94 @@ def get_query_string(args, kwargs):
     return rs.loc.source.body if isinstance(rs, Document) else rs
 
 
+# ``__typename`` alone, added to most queries by clients, doesn't count
+_INTROSPECTION_RE = re.compile(r'__schema\b|__type\s*\(')
+
+
+def maybe_introspection(query):
+    """
+    Cheap check whether ``query`` string may be an introspection query.
+    """
+    return bool(query) and _INTROSPECTION_RE.search(query) is not None
+
+
+def is_introspection(request):
+    """
+    Determines if ``request`` string or ``Document`` is an introspection query.
+
+    Introspection query selects ``__schema`` or ``__type`` and only
+    introspection fields at the top level.
+    """
+    is_document = isinstance(request, Document)
+    query = request.loc.source.body if is_document else request
+    # avoid parsing regular queries
+    if not maybe_introspection(query):
+        return False
+    try:
+        document = request if is_document else parse(request)
+    except GraphQLError:
+        return False
+    operations = [
+        definition for definition in document.definitions
+        if isinstance(definition, OperationDefinition)
+    ]
+    return bool(operations) and all(
+        isinstance(selection, Field)
+        and selection.name.value.startswith('__')
+        for operation in operations
+        for selection in operation.selection_set.selections
+    )
+
+
+def introspection_cache_key(query, args, kwargs):
+    """
+    Returns cache key for introspection ``query`` executed with ``args``,
+    ``kwargs`` of original function or ``None`` if result can't be cached.
+    """
+    # positional execution options and promises are not supported
+    if len(args) > 2 or kwargs.get('return_promise'):
+        return None
+    variables = kwargs.get('variable_values') or kwargs.get('variables')
+    try:
+        variables = (
+            json.dumps(variables, sort_keys=True) if variables else None)
+    except TypeError:
+        return None
+    return query, kwargs.get('operation_name'), variables
+
+
+class LRUCache(object):
+    """
+    Thread-safe mapping keeping at most ``size`` recently used items.
+    """
+
+    def __init__(self, size):
+        self.size = size
+        self._items = OrderedDict()
+        self._lock = threading.Lock()
+
+    def __len__(self):
+        return len(self._items)
+
+    def get(self, key):
+        with self._lock:
+            value = self._items.get(key)
+            if value is not None:
+                self._items.move_to_end(key)
+            return value
+
+    def set(self, key, value):
+        with self._lock:
+            self._items[key] = value
+            self._items.move_to_end(key)
+            while len(self._items) > self.size:
+                self._items.popitem(last=False)
+
+    def clear(self):
+        with self._lock:
+            self._items.clear()
+
+
 def is_server_error(result, ignore_exceptions):
     """
     Determines from ``result`` if server error occured.
@@ -142,3 +234,27 @@ def resolve_query_res(query):
     # split by '{' for queries without arguments
     # rather full query than empty resource name
     return re.split('[({]', query, 1)[0].strip() or query
+
+
+# ``time.thread_time`` is available since python 3.7, fall back to process
+# wide CPU time on older versions
+_cpu_clock = getattr(time, 'thread_time', time.process_time)
+
+
+def thread_cpu_time():
+    """
+    Returns CPU time, in seconds, consumed by the current thread.
+    """
+    return _cpu_clock()
+
+
+def cpu_ratio(cpu_time, wall_time):
+    """
+    Returns share of ``wall_time`` spent on CPU, capped to ``<0, 1>``.
+
+    Ratio close to ``1`` means CPU bound work, close to ``0`` means waiting
+    (I/O, locks, ...).
+    """
+    if wall_time <= 0:
+        return 0.0
+    return max(0.0, min(1.0, cpu_time / wall_time))
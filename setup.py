@@ -30,5 +30,11 @@ setup(
     keywords="tracing datadog graphql graphene",
     packages=find_packages(exclude=["tests"]),  # Required
     install_requires=["ddtrace", "graphql-core", "wrapt"],
-    extras_require={"test": ["tox", "pytest", "pytest-cov"]},
+    extras_require={
+        "test": [
+            "tox", "pytest", "pytest-cov", "flask-graphql", "graphene-django",
+        ],
+        "flask": ["flask-graphql"],
+        "django": ["graphene-django"],
+    },
 )
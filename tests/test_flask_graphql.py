@@ -0,0 +1,89 @@
+import json
+
+import pytest
+
+flask = pytest.importorskip('flask')
+pytest.importorskip('flask_graphql')
+
+from flask_graphql import GraphQLView
+
+from ddtrace_graphql.contrib import (
+    ENCODE_RES_NAME, PARSE_BODY_RES_NAME, REQUEST_RES_NAME, REQUEST_SIZE,
+    RESPONSE_SIZE, flask_graphql
+)
+from ddtrace_graphql.base import RES_NAME
+
+from .test_graphql import get_traced_schema
+
+
+@pytest.fixture
+def traced():
+    flask_graphql.patch()
+    yield
+    flask_graphql.unpatch()
+
+
+def get_client(schema):
+    app = flask.Flask(__name__)
+    app.add_url_rule(
+        '/graphql',
+        view_func=GraphQLView.as_view('graphql', schema=schema),
+    )
+    return app.test_client()
+
+
+def test_request_spans(traced):
+    tracer, schema = get_traced_schema()
+    body = json.dumps({'query': '{ hello }'})
+    response = get_client(schema).post(
+        '/graphql', data=body, content_type='application/json')
+    assert response.status_code == 200
+
+    spans = {span.name: span for span in tracer.writer.pop()}
+    assert set(spans) == {
+        REQUEST_RES_NAME, PARSE_BODY_RES_NAME, RES_NAME, ENCODE_RES_NAME,
+    }
+    request_span = spans[REQUEST_RES_NAME]
+    assert request_span.parent_id is None
+    assert request_span.resource == 'POST /graphql'
+    assert request_span.get_tag('http.status_code') == '200'
+    assert request_span.get_metric(REQUEST_SIZE) == len(body)
+    assert request_span.get_metric(RESPONSE_SIZE) == len(response.data)
+
+    for name in (PARSE_BODY_RES_NAME, RES_NAME, ENCODE_RES_NAME):
+        assert spans[name].parent_id == request_span.span_id
+    assert spans[PARSE_BODY_RES_NAME].get_metric(REQUEST_SIZE) == len(body)
+    assert spans[RES_NAME].get_metric(REQUEST_SIZE) == len('{ hello }')
+    assert (
+        spans[ENCODE_RES_NAME].get_metric(RESPONSE_SIZE) ==
+        len(response.data)
+    )
+
+
+def test_unpatch(traced):
+    flask_graphql.unpatch()
+    tracer, schema = get_traced_schema()
+    response = get_client(schema).get('/graphql?query={ hello }')
+    assert json.loads(response.data) == {'data': {'hello': 'world'}}
+    assert not tracer.writer.pop()
+    flask_graphql.patch()
+
+
+def test_graphiql_response_size(traced):
+    tracer, schema = get_traced_schema()
+    app = flask.Flask(__name__)
+    app.add_url_rule(
+        '/graphql',
+        view_func=GraphQLView.as_view(
+            'graphql', schema=schema, graphiql=True,
+            graphiql_html_title='Gráf'),
+    )
+    response = app.test_client().get(
+        '/graphql?query={ hello }', headers={'Accept': 'text/html'})
+    assert 'Gráf' in response.data.decode('utf-8')
+
+    spans = {span.name: span for span in tracer.writer.pop()}
+    assert (
+        spans[REQUEST_RES_NAME].get_metric(RESPONSE_SIZE) ==
+        len(response.data)
+    )
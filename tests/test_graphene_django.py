@@ -0,0 +1,90 @@
+import json
+
+import pytest
+
+django = pytest.importorskip('django')
+
+from django.conf import settings
+
+# graphene-django reads settings at import time
+if not settings.configured:
+    settings.configure(
+        ALLOWED_HOSTS=['*'],
+        ROOT_URLCONF=__name__,
+    )
+    django.setup()
+
+pytest.importorskip('graphene_django')
+
+from django.test import RequestFactory, override_settings
+from graphene_django.views import GraphQLView
+
+from ddtrace_graphql.contrib import (
+    ENCODE_RES_NAME, PARSE_BODY_RES_NAME, REQUEST_RES_NAME, REQUEST_SIZE,
+    RESPONSE_SIZE, graphene_django
+)
+from ddtrace_graphql.base import RES_NAME
+
+from .test_graphql import get_traced_schema
+
+urlpatterns = []
+
+
+@pytest.fixture
+def traced():
+    graphene_django.patch()
+    yield
+    graphene_django.unpatch()
+
+
+def test_request_spans(traced):
+    tracer, schema = get_traced_schema()
+    view = GraphQLView.as_view(schema=schema)
+    body = json.dumps({'query': '{ hello }'})
+    request = RequestFactory().post(
+        '/graphql', data=body, content_type='application/json')
+    response = view(request)
+    assert response.status_code == 200
+
+    spans = {span.name: span for span in tracer.writer.pop()}
+    assert set(spans) == {
+        REQUEST_RES_NAME, PARSE_BODY_RES_NAME, RES_NAME, ENCODE_RES_NAME,
+    }
+    request_span = spans[REQUEST_RES_NAME]
+    assert request_span.parent_id is None
+    assert request_span.resource == 'POST /graphql'
+    assert request_span.get_tag('http.status_code') == '200'
+    assert request_span.get_metric(REQUEST_SIZE) == len(body)
+    assert request_span.get_metric(RESPONSE_SIZE) == len(response.content)
+
+    for name in (PARSE_BODY_RES_NAME, RES_NAME, ENCODE_RES_NAME):
+        assert spans[name].parent_id == request_span.span_id
+    assert spans[PARSE_BODY_RES_NAME].get_metric(REQUEST_SIZE) == len(body)
+    assert spans[RES_NAME].get_metric(REQUEST_SIZE) == len('{ hello }')
+    assert (
+        spans[ENCODE_RES_NAME].get_metric(RESPONSE_SIZE) ==
+        len(response.content)
+    )
+
+
+def test_unpatch(traced):
+    graphene_django.unpatch()
+    tracer, schema = get_traced_schema()
+    view = GraphQLView.as_view(schema=schema)
+    response = view(RequestFactory().get('/graphql', {'query': '{ hello }'}))
+    assert json.loads(response.content) == {'data': {'hello': 'world'}}
+    assert not tracer.writer.pop()
+    graphene_django.patch()
+
+
+@override_settings(ALLOWED_HOSTS=['api.example.com'])
+def test_disallowed_host(traced):
+    tracer, schema = get_traced_schema()
+    view = GraphQLView.as_view(schema=schema)
+    request = RequestFactory().get(
+        '/graphql', {'query': '{ hello }'}, HTTP_HOST='other.example.com')
+    response = view(request)
+    assert response.status_code == 200
+
+    spans = {span.name: span for span in tracer.writer.pop()}
+    assert spans[REQUEST_RES_NAME].get_tag('http.url') == '/graphql'
@@ -1,5 +1,6 @@
 import json
 import os
+import time
 
 import graphql
 from ddtrace.encoding import JSONEncoder, MsgpackEncoder
@@ -8,16 +9,24 @@ from ddtrace.tracer import Tracer
 from ddtrace.writer import AgentWriter
 from graphql import GraphQLField, GraphQLObjectType, GraphQLString
 from graphql.execution import ExecutionResult
+from graphql.execution.middleware import MiddlewareManager
 from graphql.language.parser import parse as graphql_parse
 from graphql.language.source import Source as GraphQLSource
+from graphql.utils.introspection_query import introspection_query
 from wrapt import FunctionWrapper
 
 import ddtrace_graphql
 from ddtrace_graphql import (
-    DATA_EMPTY, ERRORS, INVALID, QUERY, SERVICE, CLIENT_ERROR,
-    TracedGraphQLSchema, patch, traced_graphql, unpatch
+    DATA_EMPTY, ERRORS, INVALID, QUERY, SERVICE, CLIENT_ERROR, CPU_TIME,
+    CPU_RATIO, DEADLINE_EXCEEDED, FIELDS_SKIPPED, INTROSPECTION,
+    INTROSPECTION_CACHE_HIT, DeadlineExceeded, TracedGraphQLSchema, patch,
+    traced_graphql, unpatch
 )
-from ddtrace_graphql.base import traced_graphql_wrapped
+from ddtrace_graphql import utils
+from ddtrace_graphql.base import (
+    INTROSPECTION_CACHE_SIZE, traced_graphql_wrapped
+)
+from ddtrace_graphql.deadline import with_deadline
 
 
 class DummyWriter(AgentWriter):
@@ -343,6 +352,302 @@ class TestGraphQL:
         span = tracer.writer.pop()[0]
         assert span.service == 'test.test'
 
+    @staticmethod
+    def test_cpu_time():
+        def busy_resolver(*_):
+            sum(i * i for i in range(100000))
+            return 'world'
+
+        tracer, schema = get_traced_schema(resolver=busy_resolver)
+        traced_graphql(schema, '{ hello }')
+        span = tracer.writer.pop()[0]
+        assert span.get_metric(CPU_TIME) > 0
+        assert 0 < span.get_metric(CPU_RATIO) <= 1
+
+        def sleepy_resolver(*_):
+            time.sleep(0.05)
+            return 'world'
+
+        tracer, schema = get_traced_schema(resolver=sleepy_resolver)
+        traced_graphql(schema, '{ hello }')
+        span = tracer.writer.pop()[0]
+        assert span.get_metric(CPU_TIME) < 0.05
+        assert span.get_metric(CPU_RATIO) < 0.5
+
+    @staticmethod
+    def test_deadline():
+        def slow_resolver(*_):
+            time.sleep(0.02)
+            return 'slow'
+
+        query = GraphQLObjectType(
+            name='RootQueryType',
+            fields={
+                'slow': GraphQLField(GraphQLString, resolver=slow_resolver),
+                'fast': GraphQLField(GraphQLString, resolver=lambda *_: 'f'),
+            }
+        )
+        tracer, schema = get_traced_schema(query=query)
+
+        result = traced_graphql(schema, 'query q { slow fast }', deadline=1)
+        span = tracer.writer.pop()[0]
+        assert result.data == {'slow': 'slow', 'fast': 'f'}
+        assert not result.errors
+        assert span.get_metric(DEADLINE_EXCEEDED) == 0
+        assert span.get_metric(FIELDS_SKIPPED) == 0
+
+        result = traced_graphql(
+            schema,
+            'query q { slow fast }',
+            deadline=1,
+            deadlines={'query q': 0.01},
+            ignore_exceptions=(DeadlineExceeded,),
+        )
+        span = tracer.writer.pop()[0]
+        assert result.data == {'slow': 'slow', 'fast': None}
+        assert len(result.errors) == 1
+        assert isinstance(result.errors[0], DeadlineExceeded)
+        assert span.get_metric(DEADLINE_EXCEEDED) == 1
+        assert span.get_metric(FIELDS_SKIPPED) == 1
+        assert span.get_metric(CLIENT_ERROR) == 1
+        assert span.error == 0
+
+        # last resolver running past the deadline sheds nothing
+        result = traced_graphql(schema, 'query q { fast slow }', deadline=0.01)
+        span = tracer.writer.pop()[0]
+        assert result.data == {'fast': 'f', 'slow': 'slow'}
+        assert not result.errors
+        assert span.get_metric(DEADLINE_EXCEEDED) == 0
+        assert span.get_metric(FIELDS_SKIPPED) == 0
+
+        # no deadline, no metrics
+        traced_graphql(schema, 'query q { slow fast }')
+        span = tracer.writer.pop()[0]
+        assert span.get_metric(DEADLINE_EXCEEDED) is None
+
+    @staticmethod
+    def test_deadline_middleware():
+        def middleware(next, root, info, **args):
+            return next(root, info, **args)
+
+        for passed, wrap_in_promise in (
+            (None, False),
+            ([], False),
+            ([middleware], True),
+            (MiddlewareManager(middleware), True),
+            (MiddlewareManager(middleware, wrap_in_promise=False), False),
+        ):
+            kwargs, deadline_middleware = with_deadline(
+                (None, None), {'middleware': passed}, 1)
+            manager = kwargs['middleware']
+            assert isinstance(manager, MiddlewareManager)
+            assert manager.wrap_in_promise is wrap_in_promise
+            assert manager.middlewares[-1] is deadline_middleware
+
+        # nested calls share the deadline
+        assert with_deadline((None, None), kwargs, 1) == (kwargs, None)
+
+        # positional middleware
+        args = (None, '{ hello }', None, None, None, None, [middleware])
+        assert with_deadline(args, {}, 1) == ({}, None)
+        tracer, schema = get_traced_schema()
+        result = traced_graphql(
+            schema, '{ hello }', None, None, None, None, [middleware],
+            deadline=0)
+        assert result.data == {'hello': 'world'}
+        span = tracer.writer.pop()[0]
+        assert span.get_metric(DEADLINE_EXCEEDED) is None
+
+    @staticmethod
+    def test_deadline_promise_middleware():
+        def upper_middleware(next, root, info, **args):
+            return next(root, info, **args).then(str.upper)
+
+        tracer, schema = get_traced_schema()
+        result = traced_graphql(
+            schema, '{ hello }', middleware=[upper_middleware], deadline=5)
+        assert not result.errors
+        assert result.data == {'hello': 'WORLD'}
+
+    @staticmethod
+    def test_deadline_patch():
+        def slow_resolver(*_):
+            time.sleep(0.02)
+            return 'world'
+
+        tracer, schema = get_traced_schema(resolver=slow_resolver)
+        patch(deadline=0.01)
+        try:
+            result = graphql.graphql(schema, '{ hello hi: hello }')
+        finally:
+            unpatch()
+        assert result.data == {'hello': 'world', 'hi': None}
+        assert len(result.errors) == 1
+        spans = tracer.writer.pop()
+        assert len(spans) == 2
+        assert [span.get_metric(FIELDS_SKIPPED) for span in spans] == [1, None]
+        assert spans[0].error == 1
+
+    @staticmethod
+    def test_is_introspection():
+        assert utils.is_introspection(introspection_query)
+        assert utils.is_introspection('{ __type(name: "Query") { name } }')
+        assert utils.is_introspection(
+            graphql_parse('{ __schema { types { name } } __typename }'))
+        assert not utils.is_introspection('{ __typename }')
+        assert not utils.is_introspection('{ hello }')
+        assert not utils.is_introspection('{ hello __schema { types } }')
+        assert not utils.is_introspection('{ __schema ')
+        assert not utils.is_introspection(None)
+
+    @staticmethod
+    def test_introspection():
+        tracer, schema = get_traced_schema()
+        result = traced_graphql(schema, introspection_query)
+        assert not result.errors
+        span = tracer.writer.pop()[0]
+        assert span.resource == INTROSPECTION
+        assert span.get_tag(QUERY) is None
+        assert span.get_metric(INTROSPECTION) == 1
+        assert span.get_metric(INTROSPECTION_CACHE_HIT) is None
+
+        traced_graphql(schema, '{ hello }')
+        span = tracer.writer.pop()[0]
+        assert span.get_tag(QUERY) == '{ hello }'
+        assert span.get_metric(INTROSPECTION) == 0
+
+    @staticmethod
+    def test_introspection_cache():
+        tracer, schema = get_traced_schema()
+        schema = TracedGraphQLSchema(
+            query=schema.get_query_type(),
+            datadog_tracer=tracer,
+            cache_introspection=True,
+        )
+
+        result = traced_graphql(schema, introspection_query)
+        span = tracer.writer.pop()[0]
+        assert span.get_metric(INTROSPECTION_CACHE_HIT) == 0
+
+        cached = traced_graphql(schema, introspection_query)
+        span = tracer.writer.pop()[0]
+        assert span.get_metric(INTROSPECTION_CACHE_HIT) == 1
+        assert cached is result
+
+        # regular queries are not cached
+        traced_graphql(schema, '{ hello }')
+        span = tracer.writer.pop()[0]
+        assert span.get_metric(INTROSPECTION_CACHE_HIT) is None
+
+        # schema change invalidates the cache
+        schema._query = GraphQLObjectType(
+            name='RootQueryType',
+            fields={'hi': GraphQLField(GraphQLString)},
+        )
+        traced_graphql(schema, introspection_query)
+        span = tracer.writer.pop()[0]
+        assert span.get_metric(INTROSPECTION_CACHE_HIT) == 0
+
+    @staticmethod
+    def test_introspection_cache_tracer_disabled():
+        tracer, schema = get_traced_schema()
+        schema = TracedGraphQLSchema(
+            query=schema.get_query_type(),
+            datadog_tracer=tracer,
+            cache_introspection=True,
+        )
+        tracer.enabled = False
+        result = traced_graphql(schema, introspection_query)
+        assert len(schema.introspection_cache) == 1
+        assert traced_graphql(schema, introspection_query) is result
+        assert not tracer.writer.pop()
+
+        # cache filled with tracer disabled is used when enabled
+        tracer.enabled = True
+        assert traced_graphql(schema, introspection_query) is result
+        span = tracer.writer.pop()[0]
+        assert span.get_metric(INTROSPECTION_CACHE_HIT) == 1
+
+        # regular queries are not cached
+        tracer.enabled = False
+        traced_graphql(schema, '{ hello }')
+        assert len(schema.introspection_cache) == 1
+
+        schema.invalidate_introspection_cache()
+        assert not len(schema.introspection_cache)
+
+    @staticmethod
+    def test_introspection_cache_lookup_before_parse(monkeypatch):
+        tracer, schema = get_traced_schema()
+        schema = TracedGraphQLSchema(
+            query=schema.get_query_type(),
+            datadog_tracer=tracer,
+            cache_introspection=True,
+        )
+        parsed = []
+
+        def parse(*args, **kwargs):
+            parsed.append(args)
+            return graphql_parse(*args, **kwargs)
+
+        monkeypatch.setattr(utils, 'parse', parse)
+
+        traced_graphql(schema, introspection_query)
+        assert len(parsed) == 1
+        traced_graphql(schema, introspection_query)
+        assert len(parsed) == 1
+        span = tracer.writer.pop()[-1]
+        assert span.get_metric(INTROSPECTION_CACHE_HIT) == 1
+
+        # ``__typename`` added by clients doesn't trigger extra parsing
+        traced_graphql(schema, '{ hello __typename }')
+        assert len(parsed) == 1
+
+    @staticmethod
+    def test_introspection_cache_size():
+        tracer, schema = get_traced_schema()
+        schema = TracedGraphQLSchema(
+            query=schema.get_query_type(),
+            datadog_tracer=tracer,
+            cache_introspection=True,
+        )
+        for i in range(INTROSPECTION_CACHE_SIZE * 2):
+            traced_graphql(
+                schema, '{ __schema { a%d: queryType { name } } }' % i)
+        assert len(schema.introspection_cache) == INTROSPECTION_CACHE_SIZE
+
+        # least recently used is evicted
+        traced_graphql(schema, '{ __schema { a16: queryType { name } } }')
+        traced_graphql(schema, '{ __schema { x: queryType { name } } }')
+        tracer.writer.pop()
+        traced_graphql(schema, '{ __schema { a16: queryType { name } } }')
+        traced_graphql(schema, '{ __schema { a17: queryType { name } } }')
+        spans = tracer.writer.pop()
+        assert spans[0].get_metric(INTROSPECTION_CACHE_HIT) == 1
+        assert spans[1].get_metric(INTROSPECTION_CACHE_HIT) == 0
+
+    @staticmethod
+    def test_introspection_cache_deadline():
+        tracer, schema = get_traced_schema()
+        schema = TracedGraphQLSchema(
+            query=schema.get_query_type(),
+            datadog_tracer=tracer,
+            cache_introspection=True,
+        )
+        query = '{ __type(name: "RootQueryType") { name description } }'
+
+        result = traced_graphql(schema, query, deadline=0)
+        assert result.data == {'__type': None}
+        assert isinstance(result.errors[0], DeadlineExceeded)
+        assert not len(schema.introspection_cache)
+
+        result = traced_graphql(schema, query)
+        assert result.data == {
+            '__type': {'name': 'RootQueryType', 'description': None}}
+        assert not result.errors
+        span = tracer.writer.pop()[-1]
+        assert span.get_metric(INTROSPECTION_CACHE_HIT) == 0
+
     @staticmethod
     def test_tracer_disabled():
         query = '{ hello world }'